@@ -1,17 +1,68 @@
+import importlib
+
 import rich_click as click
 
-from armonik_cli import commands, __version__
+from typing import Any, Dict, List, Optional
+
+from armonik_cli import __version__
+
+
+class LazyGroup(click.RichGroup):
+    """
+    A Click group whose subcommands are only imported when they are looked up, so that commands
+    that don't need them (e.g. '--version') don't pay the import cost of every command group.
+
+    Attributes:
+        lazy_commands: A mapping of subcommand names to the location of the corresponding command
+            object, given as 'module:attribute'.
+    """
+
+    def __init__(self, *args: Any, lazy_commands: Optional[Dict[str, str]] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
 
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """
+        List the names of the subcommands, including the ones that are not loaded yet.
 
-@click.group(name="armonik", context_settings={"help_option_names": ["-h", "--help"]})
+        Args:
+            ctx: The Click context.
+
+        Returns:
+            The sorted subcommand names.
+        """
+        return sorted([*super().list_commands(ctx), *self.lazy_commands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """
+        Get a subcommand by name, importing its module if it is a lazy subcommand.
+
+        Args:
+            ctx: The Click context.
+            cmd_name: The name of the subcommand.
+
+        Returns:
+            The subcommand or None if there is no subcommand with this name.
+        """
+        if cmd_name in self.lazy_commands:
+            module_name, attr_name = self.lazy_commands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    name="armonik",
+    cls=LazyGroup,
+    lazy_commands={
+        "session": "armonik_cli.commands.sessions:sessions",
+        "task": "armonik_cli.commands.tasks:tasks",
+        "partition": "armonik_cli.commands.partitions:partitions",
+    },
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
 @click.version_option(version=__version__, prog_name="armonik")
 def cli() -> None:
     """
     ArmoniK CLI is a tool to monitor and manage ArmoniK clusters.
     """
     pass
-
-
-cli.add_command(commands.sessions)
-cli.add_command(commands.tasks)
-cli.add_command(commands.partitions)
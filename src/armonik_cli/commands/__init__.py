@@ -1,6 +1,15 @@
-from .sessions import sessions
-from .tasks import tasks
-from .partitions import partitions
+import importlib
+
+from typing import Any
 
 
 __all__ = ["sessions", "tasks", "partitions"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the command groups on first access only, so that loading one of them doesn't load
+    # the others.
+    if name in __all__:
+        return getattr(importlib.import_module(f"{__name__}.{name}"), name)
+    msg = f"module '{__name__}' has no attribute '{name}'"
+    raise AttributeError(msg)
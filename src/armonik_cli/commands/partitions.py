@@ -1,14 +1,17 @@
-import grpc
 import rich_click as click
 
-from typing import List, Union
+from itertools import chain
+from typing import TYPE_CHECKING, List, Union
 
-from armonik.client.partitions import ArmoniKPartitions
 from armonik.common.filter import Filter, PartitionFilter
-from armonik.common import Partition, Direction
+from armonik.common import Partition
 
-from armonik_cli.core import console, base_command
+from armonik_cli.core import console, base_command, get_client
 from armonik_cli.core.params import FilterParam, FieldParam
+from armonik_cli.utils import SORT_DIRECTIONS, iter_pages, list_by_ids
+
+if TYPE_CHECKING:
+    from armonik.client.partitions import ArmoniKPartitions
 
 PARTITIONS_TABLE_COLS = [("ID", "Id"), ("PodReserved", "PodReserved"), ("PodMax", "PodMax")]
 
@@ -58,29 +61,22 @@ def partition_list(
     debug: bool,
 ) -> None:
     """List the partitions in an ArmoniK cluster."""
-    with grpc.insecure_channel(endpoint) as channel:
-        partitions_client = ArmoniKPartitions(channel)
-        curr_page = page if page > 0 else 0
-        partitions_list = []
-        while True:
-            total, partitions = partitions_client.list_partitions(
-                partition_filter=filter_with,
-                sort_field=Partition.id if sort_by is None else sort_by,
-                sort_direction=Direction.ASC
-                if sort_direction.capitalize() == "ASC"
-                else Direction.DESC,
-                page=curr_page,
-                page_size=page_size,
-            )
-            partitions_list += partitions
-            if page > 0 or len(partitions_list) >= total:
-                break
-            curr_page += 1
+    partitions_list = iter_pages(
+        lambda **kwargs: _partitions_client(endpoint).list_partitions(**kwargs),
+        page=page,
+        page_size=page_size,
+        partition_filter=filter_with,
+        sort_field=Partition.id if sort_by is None else sort_by,
+        sort_direction=SORT_DIRECTIONS[sort_direction.lower()],
+    )
 
-        if total > 0:
-            console.formatted_print(
-                partitions_list, format=output, table_cols=PARTITIONS_TABLE_COLS
-            )
+    first_partition = next(partitions_list, None)
+    if first_partition is not None:
+        console.formatted_print(
+            chain([first_partition], partitions_list),
+            format=output,
+            table_cols=PARTITIONS_TABLE_COLS,
+        )
 
 
 @partitions.command(name="get")
@@ -88,10 +84,20 @@ def partition_list(
 @base_command
 def partition_get(endpoint: str, output: str, partition_ids: List[str], debug: bool) -> None:
     """Get a specific partition from an ArmoniK cluster given a <PARTITION-ID>."""
-    with grpc.insecure_channel(endpoint) as channel:
-        partitions_client = ArmoniKPartitions(channel)
-        partitions = []
-        for partition_id in partition_ids:
-            partition = partitions_client.get_partition(partition_id)
-            partitions.append(partition)
-        console.formatted_print(partitions, format=output, table_cols=PARTITIONS_TABLE_COLS)
+    partitions_client = _partitions_client(endpoint)
+    if len(partition_ids) == 1:
+        partitions = [partitions_client.get_partition(partition_ids[0])]
+    else:
+        partitions = list_by_ids(
+            partitions_client.list_partitions,
+            Partition.id,
+            partition_ids,
+            filter_name="partition_filter",
+        )
+    console.formatted_print(partitions, format=output, table_cols=PARTITIONS_TABLE_COLS)
+
+
+def _partitions_client(endpoint: str) -> "ArmoniKPartitions":
+    from armonik.client.partitions import ArmoniKPartitions
+
+    return get_client(ArmoniKPartitions, endpoint)
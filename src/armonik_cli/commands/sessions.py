@@ -1,19 +1,37 @@
 import grpc
 import rich_click as click
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from datetime import timedelta
-from typing import List, Tuple, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 
-from armonik.client.sessions import ArmoniKSessions
-from armonik.common import SessionStatus, Session, TaskOptions, Direction
+from armonik.common import SessionStatus, Session, TaskOptions
 from armonik.common.filter import SessionFilter, Filter
 
-from armonik_cli.core import console, base_command, KeyValuePairParam, TimeDeltaParam, FilterParam
+from armonik_cli.core import (
+    console,
+    base_command,
+    get_client,
+    KeyValuePairParam,
+    TimeDeltaParam,
+    FilterParam,
+)
 from armonik_cli.core.params import FieldParam
+from armonik_cli.exceptions import InternalArmoniKError, NotFoundError
+from armonik_cli.utils import SORT_DIRECTIONS, iter_pages, list_by_ids
+
+if TYPE_CHECKING:
+    from armonik.client.sessions import ArmoniKSessions
 
 
 SESSION_TABLE_COLS = [("ID", "SessionId"), ("Status", "Status"), ("CreatedAt", "CreatedAt")]
+MAX_CONCURRENT_REQUESTS = 32
 session_argument = click.argument("session-id", required=True, type=str, metavar="SESSION_ID")
+session_ids_argument = click.argument(
+    "session-ids", type=str, nargs=-1, required=True, metavar="SESSION_ID..."
+)
 
 
 @click.group(name="session")
@@ -50,7 +68,7 @@ def sessions() -> None:
 )
 @click.option("--page-size", default=100, help="Number of elements in each page")
 @base_command
-def list(
+def session_list(
     endpoint: str,
     output: str,
     filter_with: Union[SessionFilter, None],
@@ -61,43 +79,50 @@ def list(
     debug: bool,
 ) -> None:
     """List the sessions of an ArmoniK cluster."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        curr_page = page if page > 0 else 0
-        session_list = []
-        while True:
-            total, sessions = sessions_client.list_sessions(
-                session_filter=filter_with,
-                sort_field=Session.session_id if sort_by is None else sort_by,
-                sort_direction=Direction.ASC
-                if sort_direction.capitalize() == "ASC"
-                else Direction.DESC,
-                page=curr_page,
-                page_size=page_size,
-            )
-            session_list += sessions
-            if page > 0 or len(session_list) >= total:
-                break
-            curr_page += 1
-
-    if total > 0:
-        session_list = [_clean_up_status(s) for s in session_list]
-        console.formatted_print(session_list, format=output, table_cols=SESSION_TABLE_COLS)
+    sessions = map(
+        _clean_up_status,
+        iter_pages(
+            lambda **kwargs: _sessions_client(endpoint).list_sessions(**kwargs),
+            page=page,
+            page_size=page_size,
+            session_filter=filter_with,
+            sort_field=Session.session_id if sort_by is None else sort_by,
+            sort_direction=SORT_DIRECTIONS[sort_direction.lower()],
+        ),
+    )
+
+    first_session = next(sessions, None)
+    if first_session is not None:
+        console.formatted_print(
+            chain([first_session], sessions), format=output, table_cols=SESSION_TABLE_COLS
+        )
 
     # TODO: Use logger to display this information
     # console.print(f"\n{total} sessions found.")
 
 
 @sessions.command(name="get")
-@session_argument
+@session_ids_argument
 @base_command
-def session_get(endpoint: str, output: str, session_id: str, debug: bool) -> None:
-    """Get details of a given session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.get_session(session_id=session_id)
-        session = _clean_up_status(session)
+def session_get(endpoint: str, output: str, session_ids: List[str], debug: bool) -> None:
+    """Get details of one or more sessions."""
+    sessions_client = _sessions_client(endpoint)
+    if len(session_ids) == 1:
+        session = _clean_up_status(sessions_client.get_session(session_id=session_ids[0]))
         console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+    else:
+        sessions = list_by_ids(
+            sessions_client.list_sessions,
+            Session.session_id,
+            session_ids,
+            filter_name="session_filter",
+            id_attr="session_id",
+        )
+        console.formatted_print(
+            [_clean_up_status(session) for session in sessions],
+            format=output,
+            table_cols=SESSION_TABLE_COLS,
+        )
 
 
 @sessions.command(name="create")
@@ -186,39 +211,69 @@ def session_create(
     debug: bool,
 ) -> None:
     """Create a new session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session_id = sessions_client.create_session(
-            default_task_options=TaskOptions(
-                max_duration=max_duration,
-                priority=priority,
-                max_retries=max_retries,
-                partition_id=default_partition,
-                application_name=application_name,
-                application_version=application_version,
-                application_namespace=application_namespace,
-                application_service=application_service,
-                engine_type=engine_type,
-                options={k: v for k, v in option} if option else None,
-            ),
-            partition_ids=partition if partition else [default_partition],
-        )
-        session = sessions_client.get_session(session_id=session_id)
-        session = _clean_up_status(session)
-        console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+    sessions_client = _sessions_client(endpoint)
+    session_id = sessions_client.create_session(
+        default_task_options=TaskOptions(
+            max_duration=max_duration,
+            priority=priority,
+            max_retries=max_retries,
+            partition_id=default_partition,
+            application_name=application_name,
+            application_version=application_version,
+            application_namespace=application_namespace,
+            application_service=application_service,
+            engine_type=engine_type,
+            options=dict(option) if option else None,
+        ),
+        partition_ids=partition if partition else [default_partition],
+    )
+    session = sessions_client.get_session(session_id=session_id)
+    session = _clean_up_status(session)
+    console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
 
 
 @sessions.command(name="cancel")
-@click.confirmation_option("--confirm", prompt="Are you sure you want to cancel this session?")
-@session_argument
+@click.confirmation_option(
+    "--confirm", prompt="Are you sure you want to cancel the given session(s)?"
+)
+@session_ids_argument
 @base_command
-def session_cancel(endpoint: str, output: str, session_id: str, debug: bool) -> None:
-    """Cancel a session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.cancel_session(session_id=session_id)
-        session = _clean_up_status(session)
-        console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+def session_cancel(endpoint: str, output: str, session_ids: List[str], debug: bool) -> None:
+    """Cancel one or more sessions."""
+
+    def cancel(session_id: str) -> Session:
+        # Each request picks the next channel of the pool to spread them over several connections.
+        return _sessions_client(endpoint).cancel_session(session_id=session_id)
+
+    # A failed cancellation must not prevent the others from being sent nor hide their result,
+    # the cancelled sessions are printed first and the failures are then reported together.
+    cancelled: Dict[str, Session] = {}
+    errors: Dict[str, grpc.RpcError] = {}
+    with ThreadPoolExecutor(max_workers=min(len(session_ids), MAX_CONCURRENT_REQUESTS)) as pool:
+        futures = {pool.submit(cancel, session_id): session_id for session_id in session_ids}
+        for future in as_completed(futures):
+            try:
+                cancelled[futures[future]] = _clean_up_status(future.result())
+            except grpc.RpcError as err:
+                errors[futures[future]] = err
+
+    sessions = [cancelled[session_id] for session_id in session_ids if session_id in cancelled]
+    if sessions:
+        console.formatted_print(
+            sessions[0] if len(session_ids) == 1 else sessions,
+            format=output,
+            table_cols=SESSION_TABLE_COLS,
+        )
+    if errors:
+        details = "\n".join(
+            f"{session_id}: {errors[session_id].details()}"
+            for session_id in dict.fromkeys(session_ids)
+            if session_id in errors
+        )
+        msg = f"Failed to cancel session(s):\n{details}"
+        if all(err.code() == grpc.StatusCode.NOT_FOUND for err in errors.values()):
+            raise NotFoundError(msg)
+        raise InternalArmoniKError(msg)
 
 
 @sessions.command(name="pause")
@@ -226,11 +281,10 @@ def session_cancel(endpoint: str, output: str, session_id: str, debug: bool) ->
 @base_command
 def session_pause(endpoint: str, output: str, session_id: str, debug: bool) -> None:
     """Pause a session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.pause_session(session_id=session_id)
-        session = _clean_up_status(session)
-        console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+    sessions_client = _sessions_client(endpoint)
+    session = sessions_client.pause_session(session_id=session_id)
+    session = _clean_up_status(session)
+    console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
 
 
 @sessions.command(name="resume")
@@ -238,11 +292,10 @@ def session_pause(endpoint: str, output: str, session_id: str, debug: bool) -> N
 @base_command
 def session_resume(endpoint: str, output: str, session_id: str, debug: bool) -> None:
     """Resume a session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.resume_session(session_id=session_id)
-        session = _clean_up_status(session)
-        console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+    sessions_client = _sessions_client(endpoint)
+    session = sessions_client.resume_session(session_id=session_id)
+    session = _clean_up_status(session)
+    console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
 
 
 @sessions.command(name="close")
@@ -251,11 +304,10 @@ def session_resume(endpoint: str, output: str, session_id: str, debug: bool) ->
 @base_command
 def session_close(endpoint: str, output: str, session_id: str, debug: bool) -> None:
     """Close a session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.close_session(session_id=session_id)
-        session = _clean_up_status(session)
-        console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+    sessions_client = _sessions_client(endpoint)
+    session = sessions_client.close_session(session_id=session_id)
+    session = _clean_up_status(session)
+    console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
 
 
 @sessions.command(name="purge")
@@ -264,11 +316,10 @@ def session_close(endpoint: str, output: str, session_id: str, debug: bool) -> N
 @base_command
 def session_purge(endpoint: str, output: str, session_id: str, debug: bool) -> None:
     """Purge a session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.purge_session(session_id=session_id)
-        session = _clean_up_status(session)
-        console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+    sessions_client = _sessions_client(endpoint)
+    session = sessions_client.purge_session(session_id=session_id)
+    session = _clean_up_status(session)
+    console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
 
 
 @sessions.command(name="delete")
@@ -277,11 +328,10 @@ def session_purge(endpoint: str, output: str, session_id: str, debug: bool) -> N
 @base_command
 def session_delete(endpoint: str, output: str, session_id: str, debug: bool) -> None:
     """Delete a session and associated data from the cluster."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.delete_session(session_id=session_id)
-        session = _clean_up_status(session)
-        console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
+    sessions_client = _sessions_client(endpoint)
+    session = sessions_client.delete_session(session_id=session_id)
+    session = _clean_up_status(session)
+    console.formatted_print(session, format=output, table_cols=SESSION_TABLE_COLS)
 
 
 @sessions.command(name="stop-submission")
@@ -303,16 +353,28 @@ def session_stop_submission(
     endpoint: str, session_id: str, clients_only: bool, workers_only: bool, output: str, debug: bool
 ) -> None:
     """Stop clients and/or workers from submitting new tasks in a session."""
-    with grpc.insecure_channel(endpoint) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session = sessions_client.stop_submission_session(
-            session_id=session_id, client=clients_only, worker=workers_only
-        )
-        console.formatted_print(
-            _clean_up_status(session), format=output, table_cols=SESSION_TABLE_COLS
-        )
+    sessions_client = _sessions_client(endpoint)
+    session = sessions_client.stop_submission_session(
+        session_id=session_id, client=clients_only, worker=workers_only
+    )
+    console.formatted_print(_clean_up_status(session), format=output, table_cols=SESSION_TABLE_COLS)
+
+
+def _sessions_client(endpoint: str) -> "ArmoniKSessions":
+    from armonik.client.sessions import ArmoniKSessions
+
+    return get_client(ArmoniKSessions, endpoint)
+
+
+@lru_cache(maxsize=None)
+def _status_names() -> Dict[int, str]:
+    # Display names of the session statuses, e.g. SESSION_STATUS_RUNNING -> Running.
+    return {
+        status: SessionStatus.name_from_value(status).split("_")[-1].capitalize()
+        for status in SessionStatus
+    }
 
 
 def _clean_up_status(session: Session) -> Session:
-    session.status = SessionStatus.name_from_value(session.status).split("_")[-1].capitalize()
+    session.status = _status_names().get(session.status, str(session.status))
     return session
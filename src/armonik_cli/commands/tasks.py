@@ -1,16 +1,20 @@
-import grpc
 import rich_click as click
 
 from datetime import timedelta
-from typing import List, Tuple, Union
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
 
-from armonik.client.tasks import ArmoniKTasks
-from armonik.common import Task, TaskStatus, TaskDefinition, TaskOptions, Direction
+from armonik.common import Task, TaskStatus, TaskDefinition, TaskOptions
 from armonik.common.filter import TaskFilter, Filter
 
-from armonik_cli.core import console, base_command
+from armonik_cli.core import console, base_command, get_client
 from armonik_cli.core.params import KeyValuePairParam, TimeDeltaParam, FilterParam, FieldParam
 from armonik_cli.exceptions import InternalError
+from armonik_cli.utils import SORT_DIRECTIONS, iter_pages, list_by_ids
+
+if TYPE_CHECKING:
+    from armonik.client.tasks import ArmoniKTasks
 
 TASKS_TABLE_COLS = [("ID", "Id"), ("Status", "Status"), ("CreatedAt", "CreatedAt")]
 
@@ -57,29 +61,23 @@ def tasks_list(
     debug: bool,
 ) -> None:
     "List all tasks."
-    with grpc.insecure_channel(endpoint) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        curr_page = page if page > 0 else 0
-        tasks_list = []
-        while True:
-            total, curr_tasks_list = tasks_client.list_tasks(
-                task_filter=filter_with,
-                sort_field=Task.id if sort_by is None else sort_by,
-                sort_direction=Direction.ASC
-                if sort_direction.capitalize() == "ASC"
-                else Direction.DESC,
-                page=curr_page,
-                page_size=page_size,
-            )
-            tasks_list += curr_tasks_list
+    tasks_list = map(
+        _clean_up_status,
+        iter_pages(
+            lambda **kwargs: _tasks_client(endpoint).list_tasks(**kwargs),
+            page=page,
+            page_size=page_size,
+            task_filter=filter_with,
+            sort_field=Task.id if sort_by is None else sort_by,
+            sort_direction=SORT_DIRECTIONS[sort_direction.lower()],
+        ),
+    )
 
-            if page > 0 or len(tasks_list) >= total:
-                break
-            curr_page += 1
-
-    if total > 0:
-        tasks_list = [_clean_up_status(task) for task in tasks_list]
-        console.formatted_print(tasks_list, format=output, table_cols=TASKS_TABLE_COLS)
+    first_task = next(tasks_list, None)
+    if first_task is not None:
+        console.formatted_print(
+            chain([first_task], tasks_list), format=output, table_cols=TASKS_TABLE_COLS
+        )
 
 
 @tasks.command(name="get")
@@ -87,14 +85,14 @@ def tasks_list(
 @base_command
 def tasks_get(endpoint: str, output: str, task_ids: List[str], debug: bool):
     """Get a detailed overview of set of tasks given their ids."""
-    with grpc.insecure_channel(endpoint) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        tasks = []
-        for task_id in task_ids:
-            task = tasks_client.get_task(task_id)
-            task = _clean_up_status(task)
-            tasks.append(task)
-        console.formatted_print(tasks, format=output, table_cols=TASKS_TABLE_COLS)
+    tasks_client = _tasks_client(endpoint)
+    if len(task_ids) == 1:
+        tasks = [tasks_client.get_task(task_ids[0])]
+    else:
+        tasks = list_by_ids(tasks_client.list_tasks, Task.id, task_ids, filter_name="task_filter")
+    console.formatted_print(
+        [_clean_up_status(task) for task in tasks], format=output, table_cols=TASKS_TABLE_COLS
+    )
 
 
 @tasks.command(name="cancel")
@@ -102,9 +100,8 @@ def tasks_get(endpoint: str, output: str, task_ids: List[str], debug: bool):
 @base_command
 def tasks_cancel(endpoint: str, output: str, task_ids: List[str], debug: bool):
     "Cancel tasks given their ids. (They don't have to be in the same session necessarily)."
-    with grpc.insecure_channel(endpoint) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        tasks_client.cancel_tasks(task_ids)
+    tasks_client = _tasks_client(endpoint)
+    tasks_client.cancel_tasks(task_ids)
 
 
 @tasks.command(name="create")
@@ -214,45 +211,54 @@ def tasks_create(
     debug: bool,
 ):
     """Create a task."""
-    with grpc.insecure_channel(endpoint) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        task_options = None
-        if max_duration is not None and priority is not None and max_retries is not None:
-            task_options = TaskOptions(
-                max_duration,
-                priority,
-                max_retries,
-                partition_id,
-                application_name,
-                application_version,
-                application_namespace,
-                application_service,
-                engine_type,
-                options,
-            )
-        elif any(arg is not None for arg in [max_duration, priority, max_retries]):
-            console.print(
-                click.style(
-                    "If you want to pass in additional task options please provide all three (max duration, priority, max retries)",
-                    "red",
-                )
-            )
-            raise InternalError(
-                "If you want to pass in additional task options please provide all three (max duration, priority, max retries)"
+    tasks_client = _tasks_client(endpoint)
+    task_options = None
+    if max_duration is not None and priority is not None and max_retries is not None:
+        task_options = TaskOptions(
+            max_duration,
+            priority,
+            max_retries,
+            partition_id,
+            application_name,
+            application_version,
+            application_namespace,
+            application_service,
+            engine_type,
+            options,
+        )
+    elif any(arg is not None for arg in [max_duration, priority, max_retries]):
+        console.print(
+            click.style(
+                "If you want to pass in additional task options please provide all three (max duration, priority, max retries)",
+                "red",
             )
-        task_definition = TaskDefinition(
-            payload_id, expected_outputs, data_dependencies, task_options
         )
-        submitted_tasks = tasks_client.submit_tasks(session_id, [task_definition])
-
-        console.formatted_print(
-            [_clean_up_status(t) for t in submitted_tasks],
-            format=output,
-            table_cols=TASKS_TABLE_COLS,
+        raise InternalError(
+            "If you want to pass in additional task options please provide all three (max duration, priority, max retries)"
         )
+    task_definition = TaskDefinition(payload_id, expected_outputs, data_dependencies, task_options)
+    submitted_tasks = tasks_client.submit_tasks(session_id, [task_definition])
+
+    console.formatted_print(
+        [_clean_up_status(t) for t in submitted_tasks],
+        format=output,
+        table_cols=TASKS_TABLE_COLS,
+    )
+
+
+def _tasks_client(endpoint: str) -> "ArmoniKTasks":
+    from armonik.client.tasks import ArmoniKTasks
+
+    return get_client(ArmoniKTasks, endpoint)
+
+
+@lru_cache(maxsize=None)
+def _status_names() -> Dict[int, str]:
+    # Display names of the task statuses, e.g. TaskStatus.COMPLETED -> Completed.
+    return {int(status): status.name.split("_")[-1].capitalize() for status in TaskStatus}
 
 
 def _clean_up_status(task: Task) -> Task:
-    task.status = TaskStatus(task.status).name.split("_")[-1].capitalize()
+    task.status = _status_names().get(task.status, str(task.status))
     task.output = task.output.error if task.output else None
     return task
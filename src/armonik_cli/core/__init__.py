@@ -1,6 +1,15 @@
+from armonik_cli.core.channel import get_channel, get_client
 from armonik_cli.core.console import console
 from armonik_cli.core.decorators import base_command
 from armonik_cli.core.params import KeyValuePairParam, TimeDeltaParam, FilterParam
 
 
-__all__ = ["base_command", "KeyValuePairParam", "TimeDeltaParam", "FilterParam", "console"]
+__all__ = [
+    "base_command",
+    "KeyValuePairParam",
+    "TimeDeltaParam",
+    "FilterParam",
+    "console",
+    "get_channel",
+    "get_client",
+]
@@ -0,0 +1,131 @@
+import atexit
+import itertools
+import threading
+
+from functools import lru_cache
+from typing import Callable, Dict, TypeVar
+
+import grpc
+
+
+CHANNEL_OPTIONS = [
+    # Ping the server every 30 s while requests are in flight and drop the connection if a ping is
+    # not acknowledged within 10 s, rather than waiting on a dead connection.
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+    # Give each channel its own subchannels, hence its own connection, instead of letting gRPC
+    # share a single connection between all the channels to the same endpoint.
+    ("grpc.use_local_subchannel_pool", 1),
+]
+"""Options of the channels opened to the ArmoniK cluster."""
+
+POOL_SIZE = 4
+"""Number of channels opened to each endpoint."""
+
+
+class ChannelPool:
+    """
+    A fixed-size pool of gRPC channels to the same endpoint, handed out in round-robin.
+
+    Spreading concurrent requests over several channels spreads them over several HTTP/2
+    connections, which avoids queuing all the streams behind the flow control of a single one.
+
+    Attributes:
+        endpoint: The endpoint the channels are connected to.
+    """
+
+    def __init__(self, endpoint: str, size: int = POOL_SIZE) -> None:
+        """
+        Initializes the pool and opens its channels.
+
+        Args:
+            endpoint: The endpoint of the cluster to connect to.
+            size: The number of channels in the pool.
+        """
+        self.endpoint = endpoint
+        self._channels = [
+            grpc.insecure_channel(endpoint, options=CHANNEL_OPTIONS) for _ in range(size)
+        ]
+        # 'next' on an itertools.count is atomic, so channels can be picked from several threads.
+        self._counter = itertools.count()
+
+    def next(self) -> grpc.Channel:
+        """
+        Get the next channel of the pool.
+
+        Returns:
+            A gRPC channel to the endpoint of the pool.
+        """
+        return self._channels[next(self._counter) % len(self._channels)]
+
+    def close(self) -> None:
+        """Close all the channels of the pool."""
+        for channel in self._channels:
+            channel.close()
+
+
+C = TypeVar("C")
+
+_pools: Dict[str, ChannelPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_channel(endpoint: str) -> grpc.Channel:
+    """
+    Get a gRPC channel to an ArmoniK cluster.
+
+    Channels are pooled by endpoint so that all the requests sent to the same cluster during the
+    lifetime of the process share a few connections, successive calls returning the channels of
+    the pool in turn. They are closed when the interpreter exits.
+
+    Args:
+        endpoint: The endpoint of the cluster to connect to.
+
+    Returns:
+        An insecure gRPC channel to the given endpoint.
+    """
+    pool = _pools.get(endpoint)
+    if pool is None:
+        # Commands may request their first channel from several threads at once, the pool must
+        # then be created only once so that no channel is left open outside of it.
+        with _pools_lock:
+            pool = _pools.get(endpoint)
+            if pool is None:
+                pool = _pools[endpoint] = ChannelPool(endpoint)
+    return pool.next()
+
+
+def get_client(client_type: Callable[[grpc.Channel], C], endpoint: str) -> C:
+    """
+    Get an ArmoniK API client connected to a cluster.
+
+    Clients are cached per channel, so that their service stubs are built once for each channel of
+    the pool instead of once per command. The command modules import the client classes in their
+    '_<service>_client' helpers, only when a command runs, so that the generated gRPC stubs are not
+    loaded when the CLI is only asked for help.
+
+    Args:
+        client_type: The client class (e.g. 'ArmoniKSessions').
+        endpoint: The endpoint of the cluster to connect to.
+
+    Returns:
+        A client using the next pooled channel to the given endpoint.
+    """
+    return _get_client(client_type, get_channel(endpoint))
+
+
+@lru_cache(maxsize=64)
+def _get_client(client_type: Callable[[grpc.Channel], C], channel: grpc.Channel) -> C:
+    return client_type(channel)
+
+
+@atexit.register
+def close_channels() -> None:
+    """Close all the pooled channels."""
+    _get_client.cache_clear()
+    with _pools_lock:
+        while _pools:
+            _, pool = _pools.popitem()
+            pool.close()
@@ -1,12 +1,13 @@
-import json
-import yaml
+import textwrap
 
-from typing import List, Dict, Tuple, Any, Union, cast
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Union, cast
 
 from rich.console import Console
-from rich.table import Table
 
-from armonik_cli.core.serialize import CLIJSONEncoder
+from armonik_cli.core.serialize import dumps_json, serialize_fields, to_plain
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 class ArmoniKCLIConsole(Console):
@@ -21,6 +22,10 @@ class ArmoniKCLIConsole(Console):
         """
         Print an object in a specified format: JSON, YAML, or a table.
 
+        If the object is an iterator, its elements are serialized and printed one at a time as
+        they are produced instead of being gathered first, the output being the same as for the
+        equivalent list.
+
         Args:
             obj: The object to format and print.
             format: The format in which to print the object. Supported values are 'yaml', 'json', and 'table'.
@@ -30,42 +35,100 @@ class ArmoniKCLIConsole(Console):
         Raises:
             ValueError: If `format` is 'table' and `table_cols` is not provided.
         """
-        obj = cast(Dict[str, Any], json.loads(json.dumps(obj, cls=CLIJSONEncoder)))
+        if format == "table" and not table_cols:
+            raise ValueError(
+                "Missing 'table_cols' when calling 'formatted_print' with format table."
+            )
+
+        if isinstance(obj, Iterator):
+            self._stream_print(obj, format, cast(List[Tuple[str, str]], table_cols))
+            return
 
         if format == "yaml":
-            obj = yaml.dump(obj, sort_keys=False, indent=2)
+            # The YAML and table renderers are only imported when their format is requested.
+            import yaml
+
+            self._print_text(yaml.dump(to_plain(obj), sort_keys=False, indent=2))
         elif format == "table":
-            if not table_cols:
-                raise ValueError(
-                    "Missing 'table_cols' when calling 'formatted_print' with format table."
-                )
-            obj = self._build_table(obj, table_cols)
+            super().print(self._build_table(obj, cast(List[Tuple[str, str]], table_cols)))
+        else:
+            self._print_text(dumps_json(obj))
+
+    def _stream_print(
+        self, objs: Iterator[object], format: str, table_cols: List[Tuple[str, str]]
+    ) -> None:
+        """
+        Print the elements of an iterator as a list, serializing each element as it is produced.
+
+        Args:
+            objs: The iterator of objects to format and print.
+            format: The format in which to print the objects. Supported values are 'yaml', 'json', and 'table'.
+            table_cols: Columns for the table format, see `formatted_print`.
+        """
+        if format == "table":
+            super().print(self._build_table(objs, table_cols))
+        elif format == "yaml":
+            import yaml
+
+            empty = True
+            for item in map(to_plain, objs):
+                self._print_text(yaml.dump([item], sort_keys=False, indent=2), end="")
+                empty = False
+            if empty:
+                self._print_text(yaml.dump([], sort_keys=False, indent=2), end="")
+            self._print_text("")
         else:
-            obj = json.dumps(obj, sort_keys=False, indent=2)
+            # Each element is printed once the next one is known, so that it can be followed by
+            # the separator, which yields the same output as dumping the whole list.
+            previous = None
+            for obj in objs:
+                self._print_text("[" if previous is None else f"{previous},")
+                previous = textwrap.indent(dumps_json(obj), "  ")
+            self._print_text("[]" if previous is None else f"{previous}\n]")
+
+    def _print_text(self, text: str, end: str = "\n") -> None:
+        """
+        Print serialized output.
 
-        super().print(obj)
+        On a terminal, the text is rendered by Rich (highlighting, wrapping). Otherwise, e.g. when the
+        output is piped to another program, it is written as is: Rich rendering is skipped and
+        long lines are not wrapped nor markup-like content interpreted, which would alter the data.
+
+        Args:
+            text: The text to print.
+            end: The string written after the text.
+        """
+        if self.is_terminal:
+            super().print(text, end=end)
+        else:
+            self.file.write(text + end)
 
     @staticmethod
-    def _build_table(obj: Dict[str, Any], table_cols: List[Tuple[str, str]]) -> Table:
+    def _build_table(obj: object, table_cols: List[Tuple[str, str]]) -> "Table":
         """
-        Build a Rich Table object from a dictionary and column specifications.
+        Build a Rich Table object from an object and column specifications.
+
+        Only the fields displayed in the table are serialized.
 
         Args:
-            obj: The object or list of objects to display in a table.
+            obj: The object, or the list or iterator of objects, to display in a table.
             table_cols: List of tuples where each tuple contains the table column name and
-                the key in `obj` corresponding to the data to display.
+                the key in the serialized `obj` corresponding to the data to display.
 
         Returns:
             A Rich Table object with the specified columns and rows based on `obj`.
         """
+        from rich.table import Table
+
         table = Table(box=None)
 
         for col_name, _ in table_cols:
             table.add_column(col_name)
 
-        objs = obj if isinstance(obj, List) else [obj]
+        keys = [key for _, key in table_cols]
+        objs = obj if isinstance(obj, (list, tuple, Iterator)) else [obj]
         for item in objs:
-            table.add_row(*[str(item[key]) for _, key in table_cols])
+            table.add_row(*[str(value) for value in serialize_fields(item, keys)])
 
         return table
 
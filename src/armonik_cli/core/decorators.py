@@ -1,4 +1,5 @@
-from functools import wraps, partial
+from functools import reduce, wraps, partial
+from typing import Callable, TypeVar
 
 import grpc
 import rich_click as click
@@ -7,6 +8,53 @@ from armonik_cli.core.console import console
 from armonik_cli.exceptions import NotFoundError, InternalError, InternalArmoniKError
 
 
+F = TypeVar("F", bound=Callable)
+
+
+def compose(*decorators: Callable[[F], F]) -> Callable[[F], F]:
+    """Compose several decorators into a single one.
+
+    The decorators are applied right to left, so that 'compose(a, b)(func)' is equivalent to
+    stacking '@a' above '@b' on top of 'func'.
+
+    Args:
+        decorators: The decorators to compose.
+
+    Returns:
+        A decorator applying all the given decorators.
+    """
+
+    def decorator(func: F) -> F:
+        return reduce(lambda f, d: d(f), reversed(decorators), func)
+
+    return decorator
+
+
+# Options shared by every command, built once and applied by 'base_command'.
+_common_options = compose(
+    click.option(
+        "-e",
+        "--endpoint",
+        type=str,
+        required=True,
+        help="Endpoint of the cluster to connect to.",
+        metavar="ENDPOINT",
+    ),
+    click.option(
+        "-o",
+        "--output",
+        type=click.Choice(["yaml", "json", "table"], case_sensitive=False),
+        default="json",
+        show_default=True,
+        help="Commands output format.",
+        metavar="FORMAT",
+    ),
+    click.option(
+        "--debug", is_flag=True, default=False, help="Print debug logs and internal errors."
+    ),
+)
+
+
 def error_handler(func=None):
     """Decorator to ensure correct display of errors.
 
@@ -75,26 +123,7 @@ def base_command(func=None):
         return partial(base_command)
 
     # Define the wrapper function with added Click options
-    @click.option(
-        "-e",
-        "--endpoint",
-        type=str,
-        required=True,
-        help="Endpoint of the cluster to connect to.",
-        metavar="ENDPOINT",
-    )
-    @click.option(
-        "-o",
-        "--output",
-        type=click.Choice(["yaml", "json", "table"], case_sensitive=False),
-        default="json",
-        show_default=True,
-        help="Commands output format.",
-        metavar="FORMAT",
-    )
-    @click.option(
-        "--debug", is_flag=True, default=False, help="Print debug logs and internal errors."
-    )
+    @_common_options
     @error_handler
     @wraps(func)
     def wrapper(endpoint: str, output: str, debug: bool, *args, **kwargs):
@@ -1,8 +1,12 @@
+import hashlib
 import operator
+import os
+import stat
+import sys
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import cast, Any, List, Callable, Union, Optional
+from typing import cast, Any, Dict, FrozenSet, List, Callable, Type, Union, Optional
 
 from armonik.common import (
     Filter,
@@ -26,11 +30,93 @@ from armonik.common.filter import (
     FilterError,
 )
 from armonik.common.filter.filter import FType
-from lark import Lark, Transformer, Token
+from lark import Lark, Transformer, Token, __version__ as lark_version
 
 from armonik_cli.utils import parse_time_delta, remove_string_delimiters
 
 
+def _contains(filter: StringFilter, substr: str) -> BooleanFilter:
+    return filter.contains(substr)
+
+
+def _not_contains(filter: StringFilter, substr: str) -> BooleanFilter:
+    return -filter.contains(substr)
+
+
+def _startswith(filter: StringFilter, prefix: str) -> BooleanFilter:
+    return filter.startswith(prefix)
+
+
+def _endswith(filter: StringFilter, suffix: str) -> BooleanFilter:
+    return filter.endswith(suffix)
+
+
+_COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "EQ": operator.eq,
+    "NEQ": operator.ne,
+    "LT": operator.lt,
+    "LTE": operator.le,
+    "GT": operator.gt,
+    "GTE": operator.ge,
+    "CONTAINS": _contains,
+    "NOTCONTAINS": _not_contains,
+    "STARTSWITH": _startswith,
+    "ENDSWIDTH": _endswith,
+}
+_BOOLEAN_VALUES: Dict[str, bool] = {"true": True, "false": False}
+
+
+@lru_cache(maxsize=None)
+def get_filterable_fields(filter: Type[Filter]) -> FrozenSet[str]:
+    """
+    Get the names of the fields of an ArmoniK API filter that can be filtered on.
+
+    Args:
+        filter: The ArmoniK API filter class.
+
+    Returns:
+        The names of the fields whose type is neither NA nor UNKNOWN.
+    """
+    return frozenset(
+        field
+        for field, (field_type, *_) in filter._fields.items()
+        if field_type != FType.NA and field_type != FType.UNKNOWN
+    )
+
+
+def _cache_file(grammar: str) -> Optional[Path]:
+    """
+    Get the file in which to cache the parser compiled from a grammar.
+
+    The cache lives in the user's cache directory ('$XDG_CACHE_HOME/armonik', '~/.cache/armonik'
+    by default) rather than in the shared temporary directory: the cached parser is unpickled, so
+    the file must not be writable by other users. Its name is keyed on the grammar, the Lark version
+    and the Python version, so that stale caches are never loaded.
+
+    Args:
+        grammar: The grammar the parser is compiled from.
+
+    Returns:
+        The path of the cache file, or None if no private cache directory is available, in which
+        case the parser must not be cached.
+    """
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "armonik"
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        dir_stat = cache_dir.stat()
+    except (OSError, RuntimeError):
+        return None
+    if hasattr(os, "getuid") and (
+        dir_stat.st_uid != os.getuid() or dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    ):
+        return None
+    digest = hashlib.sha256(grammar.encode()).hexdigest()[:16]
+    return cache_dir / (
+        f"filter_parser_{digest}_lark{lark_version}_py{sys.version_info[0]}{sys.version_info[1]}"
+        ".pickle"
+    )
+
+
 class SemanticError(Exception):
     """
     Exception raised for semantic errors in filter expressions.
@@ -91,6 +177,7 @@ class FilterParser:
     """
 
     _grammar_file = Path(__file__).parent / "filter_grammar.lark"
+    _parser: Optional[Lark] = None
 
     def __init__(
         self,
@@ -109,14 +196,27 @@ class FilterParser:
     @classmethod
     def get_parser(cls) -> Lark:
         """
-        Generate a Lark parser for the grammar associated with the filter.
+        Get the Lark parser for the grammar associated with the filter.
+
+        The grammar is compiled into LALR tables on first use only, the resulting parser is
+        then shared by all the filter parsers of the process. The tables are also cached on disk
+        by Lark in a private directory of the user, see `_cache_file`, so that subsequent
+        processes skip the grammar compilation.
 
         Returns:
             A Lark parser instance.
         """
-        with cls._grammar_file.open() as file:
-            grammar = file.read()
-            return Lark(grammar, start="start", parser="earley")
+        if FilterParser._parser is None:
+            with cls._grammar_file.open() as file:
+                grammar = file.read()
+            cache_file = _cache_file(grammar)
+            FilterParser._parser = Lark(
+                grammar,
+                start="start",
+                parser="lalr",
+                cache=False if cache_file is None else str(cache_file),
+            )
+        return FilterParser._parser
 
     def parse(self, expression: str) -> Filter:
         """
@@ -180,7 +280,7 @@ class FilterTransformer(Transformer):
         Returns:
             The combined filter expression.
         """
-        return reduce(operator.or_, [item for item in args if not isinstance(item, Token)])
+        return reduce(operator.or_, (item for item in args if not isinstance(item, Token)))
 
     def term(self, args: List[Union[Filter, Token]]) -> Filter:
         """
@@ -192,7 +292,7 @@ class FilterTransformer(Transformer):
         Returns:
             The combined filter expression.
         """
-        return reduce(operator.and_, [item for item in args if not isinstance(item, Token)])
+        return reduce(operator.and_, (item for item in args if not isinstance(item, Token)))
 
     def factor(self, args: List[Union[Filter, Token]]) -> Filter:
         """
@@ -251,13 +351,6 @@ class FilterTransformer(Transformer):
                 expr=self._expr,
                 column=args[2].column,
             )
-        except AttributeError:
-            msg = f"{self._obj.__name__.lower()} has no status '{value}'."
-            raise SemanticError(
-                msg=msg,
-                expr=self._expr,
-                column=args[2].column,
-            )
 
     def test(self, args: List[Token]) -> BooleanFilter:
         """
@@ -311,11 +404,7 @@ class FilterTransformer(Transformer):
                         expr=self._expr,
                         column=args[0].column,
                     )
-                if (
-                    option_field not in TaskOptionFilter._fields
-                    or TaskOptionFilter._fields[option_field][0] == FType.NA
-                    or TaskOptionFilter._fields[option_field][0] == FType.UNKNOWN
-                ):
+                if option_field not in get_filterable_fields(TaskOptionFilter):
                     msg = f"{self._obj.__name__.capitalize()} fillers don't have a field '{option_field}' in the option fields."
                     raise SemanticError(
                         msg=msg,
@@ -340,11 +429,7 @@ class FilterTransformer(Transformer):
                         column=args[0].column,
                     )
                 return args[0].update(value=(field, getattr(self._obj.output, output_field)))
-            if (
-                field not in self._filter._fields
-                or self._filter._fields[field][0] == FType.NA
-                or self._filter._fields[field][0] == FType.UNKNOWN
-            ):
+            if field not in get_filterable_fields(self._filter):
                 msg = f"{self._obj.__name__.capitalize()} filters don't have a field '{field}'."
                 raise SemanticError(
                     msg=msg,
@@ -417,141 +502,19 @@ class FilterTransformer(Transformer):
         """
         return tok.update(value=parse_time_delta(tok.value))
 
-    def EQ(self, tok: Token) -> Token:
-        """
-        Maps an EQ token to the equality operator.
-
-        Args:
-            tok: An EQ token.
-
-        Returns:
-            The updated token with the equality operator.
-        """
-        return tok.update(value=operator.eq)
-
-    def NEQ(self, tok: Token) -> Token:
-        """
-        Maps an EQ token to the unequality operator.
-
-        Args:
-            tok: An NEQ token.
-
-        Returns:
-            The updated token with the unequality operator.
-        """
-        return tok.update(value=operator.ne)
-
-    def LT(self, tok: Token) -> Token:
-        """
-        Maps an LT token to the lower than operator.
-
-        Args:
-            tok: An LT token.
-
-        Returns:
-            The updated token with the lower than operator.
-        """
-        return tok.update(value=operator.lt)
-
-    def LTE(self, tok: Token) -> Token:
+    def __default_token__(self, tok: Token) -> Token:
         """
-        Maps an LTE token to the lower than or equal operator.
+        Maps a comparison operator token (EQ, NEQ, LT, LTE, GT, GTE, CONTAINS, NOTCONTAINS,
+        STARTSWITH, ENDSWIDTH) to its operator, any other token is returned as-is.
 
         Args:
-            tok: An LTE token.
+            tok: A token without a dedicated callback.
 
         Returns:
-            The updated token with the lower than or equal operator.
+            The updated token with the operator if it is a comparison operator token.
         """
-        return tok.update(value=operator.le)
-
-    def GT(self, tok: Token) -> Token:
-        """
-        Maps an GT token to the greater than operator.
-
-        Args:
-            tok: An GT token.
-
-        Returns:
-            The updated token with the greater than operator.
-        """
-        return tok.update(value=operator.gt)
-
-    def GTE(self, tok: Token) -> Token:
-        """
-        Maps an GTE token to the greater than or equal operator.
-
-        Args:
-            tok: An GTE token.
-
-        Returns:
-            The updated token with the greater than or equal operator.
-        """
-        return tok.update(value=operator.ge)
-
-    def CONTAINS(self, tok: Token) -> Token:
-        """
-        Maps an CONTAINS token to a contains operator.
-
-        Args:
-            tok: An CONTAINS token.
-
-        Returns:
-            The updated token with a function mimicking the contains operator.
-        """
-
-        def contains_func(filter: StringFilter, substr: str) -> BooleanFilter:
-            return filter.contains(substr)
-
-        return tok.update(value=contains_func)
-
-    def NOTCONTAINS(self, tok: Token) -> Token:
-        """
-        Maps an NOTCONTAINS token to a not contains operator.
-
-        Args:
-            tok: An EQ token.
-
-        Returns:
-            The updated token with a function mimicking the not contains operator
-        """
-
-        def notcontains_func(filter: StringFilter, substr: str) -> BooleanFilter:
-            return -filter.contains(substr)
-
-        return tok.update(value=notcontains_func)
-
-    def STARTSWITH(self, tok: Token) -> Token:
-        """
-        Maps an STARTSWITH token to a starts with operator.
-
-        Args:
-            tok: An STARTSWITH token.
-
-        Returns:
-            The updated token with a function mimicking the starts with operator
-        """
-
-        def startswith_func(filter: StringFilter, prefix: str) -> BooleanFilter:
-            return filter.startswith(prefix)
-
-        return tok.update(value=startswith_func)
-
-    def ENDSWIDTH(self, tok: Token) -> Token:
-        """
-        Maps an ENDSWITH token to the ends with operator.
-
-        Args:
-            tok: An ENDSWITH token.
-
-        Returns:
-            The updated token with a function mimicking the ends with operator
-        """
-
-        def endswith_func(filter: StringFilter, suffix: str) -> BooleanFilter:
-            return filter.endswith(suffix)
-
-        return tok.update(value=endswith_func)
+        op = _COMPARISON_OPERATORS.get(tok.type)
+        return tok if op is None else tok.update(value=op)
 
     def IS(self, tok: Token) -> Token:
         """
@@ -565,16 +528,14 @@ class FilterTransformer(Transformer):
         """
 
         def is_func(filter: BooleanFilter, bool_str: str) -> BooleanFilter:
-            if bool_str.lower() == "true":
-                return filter
-            elif bool_str.lower() == "false":
-                return -filter
-            else:
+            value = _BOOLEAN_VALUES.get(bool_str.lower())
+            if value is None:
                 msg = f"Invalid value for boolean field: {bool_str}."
                 raise SemanticError(
                     msg=msg,
                     expr=self._expr,
                     column=tok.column,
                 )
+            return filter if value else -filter
 
         return tok.update(value=is_func)
@@ -3,21 +3,27 @@ import re
 import rich_click as click
 
 from datetime import timedelta
-from typing import cast, Tuple, Union
+from functools import lru_cache
+from typing import Tuple, Union
 
 from armonik import common
 from armonik.common import Filter
-from armonik.common.filter.filter import FType
 from lark.exceptions import VisitError, UnexpectedInput
 
 from armonik_cli.utils import parse_time_delta
-from armonik_cli.core.filters import FilterParser
+from armonik_cli.core.filters import FilterParser, get_filterable_fields
+
+
+# The value may itself contain '=' (e.g. "JAVA_OPTS=-Dkey=value"), the key ends at the first one.
+_KEY_VALUE_PAIR_PATTERN = re.compile(r"[a-zA-Z0-9_-]+=[a-zA-Z0-9_=-]+")
 
 
 class KeyValuePairParam(click.ParamType):
     """
     A custom Click parameter type that parses a key-value pair in the format "key=value".
 
+    The pair is split at the first equal sign, so that the value may contain equal signs.
+
     Attributes:
         name: The name of the parameter type, used by Click.
     """
@@ -41,12 +47,11 @@ class KeyValuePairParam(click.ParamType):
         Raises:
             click.BadParameter: If the input does not match the expected format.
         """
-        pattern = r"^([a-zA-Z0-9_-]+)=([a-zA-Z0-9_-]+)$"
-        match_result = re.match(pattern, value)
-        if match_result:
-            return cast(Tuple[str, str], match_result.groups())
+        if _KEY_VALUE_PAIR_PATTERN.fullmatch(value):
+            key, _, val = value.partition("=")
+            return key, val
         self.fail(
-            f"{value} is not a valid key value pair. Use key=value where both key and value contain only alphanumeric characters, dashes (-), and underscores (_).",
+            f"{value} is not a valid key value pair. Use key=value where both key and value contain only alphanumeric characters, dashes (-), and underscores (_), the value may also contain equal signs (=).",
             param,
             ctx,
         )
@@ -132,13 +137,28 @@ class FilterParam(click.ParamType):
             click.BadParameter: If the input contains a syntax error.
         """
         try:
-            return self.parser.parse(value)
+            return _parse_filter(self.parser, value)
         except UnexpectedInput as error:
             self.fail(f"Filter syntax error: {error.get_context(value, span=40)}.", param, ctx)
         except VisitError as error:
             self.fail(str(error.orig_exc), param, ctx)
 
 
+@lru_cache(maxsize=256)
+def _parse_filter(parser: FilterParser, expression: str) -> Filter:
+    """
+    Parse a filter expression, memoizing the result so that repeated expressions are parsed once.
+
+    Args:
+        parser: The filter parser to use.
+        expression: The filter expression as a string.
+
+    Returns:
+        A Filter object constructed from the parsed expression.
+    """
+    return parser.parse(expression)
+
+
 class FieldParam(click.ParamType):
     """
     A custom Click parameter type that validates a field name against the possible fields of a base structure.
@@ -159,11 +179,8 @@ class FieldParam(click.ParamType):
         super().__init__()
         self.base_struct = base_struct.capitalize()
         cls = getattr(common.filter, f"{self.base_struct}Filter")
-        self.possible_fields = [
-            field
-            for field in cls._fields.keys()
-            if cls._fields[field][0] != FType.NA and cls._fields[field][0] != FType.UNKNOWN
-        ]
+        filterable_fields = get_filterable_fields(cls)
+        self.possible_fields = [field for field in cls._fields.keys() if field in filterable_fields]
 
     def convert(
         self, value: str, param: Union[click.Parameter, None], ctx: Union[click.Context, None]
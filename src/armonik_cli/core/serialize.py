@@ -1,11 +1,17 @@
 import json
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Union, Any
+from functools import lru_cache
+from typing import Dict, List, Sequence, Union, Any, cast
 
 from armonik.common import Session, TaskOptions, Task, Partition
 from google._upb._message import ScalarMapContainer, RepeatedScalarContainer
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 class CLIJSONEncoder(json.JSONEncoder):
     """
@@ -13,10 +19,10 @@ class CLIJSONEncoder(json.JSONEncoder):
     JSONs.
 
     Attributes:
-        __api_types: The list of ArmoniK API Python objects managed by this encoder.
+        __api_types: The tuple of ArmoniK API Python objects managed by this encoder.
     """
 
-    __api_types = [Session, TaskOptions, Task, Partition]
+    __api_types = (Session, TaskOptions, Task, Partition)
 
     def default(self, obj: object) -> Union[str, Dict[str, Any], List[Any]]:
         """
@@ -38,15 +44,17 @@ class CLIJSONEncoder(json.JSONEncoder):
             return json.loads(str(obj).replace("'", '"'))
         elif isinstance(obj, RepeatedScalarContainer):
             return list(obj)
-        elif any([isinstance(obj, api_type) for api_type in self.__api_types]):
+        elif isinstance(obj, self.__api_types):
             return {self.camel_case(k): v for k, v in obj.__dict__.items()}
         else:
             return super().default(obj)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def camel_case(value: str) -> str:
         """
-        Convert snake_case strings to CamelCase.
+        Convert snake_case strings to CamelCase. Conversions are memoized as they are done for the
+        same few field names on every serialized object.
 
         Args:
             value: The snake_case string to be converted.
@@ -55,3 +63,96 @@ class CLIJSONEncoder(json.JSONEncoder):
             The CamelCase equivalent of the input string.
         """
         return "".join(word.capitalize() for word in value.split("_"))
+
+
+_json_encoder = CLIJSONEncoder()
+
+if orjson is not None:
+    # Datetimes and dataclasses are passed to the encoder so that they are rendered as with the
+    # standard library.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumps_json(obj: object) -> str:
+    """
+    Serialize an object, which may contain ArmoniK API objects, to an indented JSON string.
+
+    orjson is used when it is installed, otherwise the standard library is used. Objects orjson
+    cannot encode, such as integers wider than 64 bits, are encoded with the standard library.
+    Both write non-ASCII characters as is, but the output of the two differs for some floats:
+    orjson writes NaN and infinities as null instead of NaN and Infinity, and floats in their
+    shortest form (e.g. 1e20 instead of 1e+20).
+
+    Args:
+        obj: The object to be serialized.
+
+    Returns:
+        The JSON string, indented by two spaces.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_encoder.default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, cls=CLIJSONEncoder, indent=2, ensure_ascii=False)
+
+
+def to_plain(obj: object) -> Any:
+    """
+    Convert an object, which may contain ArmoniK API objects, into plain Python data (dictionaries,
+    lists, strings, numbers, booleans and None).
+
+    The result is the same as loading back the JSON serialization of the object, but it is built
+    in a single walk, without producing and parsing the intermediate JSON string.
+
+    Args:
+        obj: The object to convert.
+
+    Returns:
+        The plain Python equivalent of the object.
+
+    Raises:
+        TypeError: If the object contains a value that cannot be serialized to JSON.
+    """
+    if obj is None or isinstance(obj, (str, bool)):
+        return obj
+    if isinstance(obj, (int, float)):
+        # Like JSON, enumeration members and other subclasses are reduced to the base type.
+        return int(obj) if isinstance(obj, int) else float(obj)
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): to_plain(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [to_plain(item) for item in obj]
+    return to_plain(_json_encoder.default(obj))
+
+
+def serialize_fields(obj: object, keys: Sequence[str]) -> List[Any]:
+    """
+    Serialize some fields of an object as they appear in its JSON serialization.
+
+    Only the requested fields are serialized, which avoids serializing whole objects when only a
+    few of their fields are displayed.
+
+    Args:
+        obj: An ArmoniK API object or a dictionary.
+        keys: The keys of the fields in the serialized object (e.g. 'SessionId').
+
+    Returns:
+        The serialized values of the fields, in the order of the keys.
+
+    Raises:
+        TypeError: If the object is neither a dictionary nor an object the encoder can serialize.
+    """
+    if isinstance(obj, dict):
+        fields = obj
+    else:
+        fields = cast(Dict[str, Any], _json_encoder.default(obj))
+    return [to_plain(fields[key]) for key in keys]
@@ -1,4 +1,27 @@
+import re
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timedelta
+from functools import reduce
+from operator import or_
+from typing import Any, Callable, Deque, Iterator, List, Sequence, Tuple, TypeVar
+
+from armonik.common import Direction
+from armonik.common.filter import Filter
+
+from armonik_cli.exceptions import NotFoundError
+
+
+T = TypeVar("T")
+
+MAX_CONCURRENT_PAGES = 4
+"""Maximum number of pages of a listing requested at once."""
+
+SORT_DIRECTIONS = {"asc": Direction.ASC, "desc": Direction.DESC}
+"""Mapping from the values of the '--sort-direction' options to the API sort directions."""
+
+_TIME_DELTA_PATTERN = re.compile(r"(-)?(?:(\d+)\.)?(\d+):(\d+):(\d+)(?:\.(\d+))?")
 
 
 def parse_time_delta(time_str: str) -> timedelta:
@@ -15,20 +38,21 @@ def parse_time_delta(time_str: str) -> timedelta:
     Raises:
         ValueError: If the input string is not in the correct format.
     """
-    negative = False
-    if time_str[0] == "-":
-        negative = True
-        time_str = time_str[0:]
-    hours, minutes, seconds = time_str.split(":")
-    days, hours = (["0"] + hours.split("."))[-2:]
-    sec, fractional_sec = (seconds.split(".") + ["0"])[:2]
-    return (-1 if negative else 1) * timedelta(
-        days=int(days),
+    match = _TIME_DELTA_PATTERN.fullmatch(time_str)
+    if match is None:
+        msg = f"'{time_str}' is not a valid time delta."
+        raise ValueError(msg)
+    sign, days, hours, minutes, seconds, fractional_sec = match.groups()
+    # The fractional part is truncated to microseconds and scaled by its number of digits.
+    fractional_sec = (fractional_sec or "")[:6]
+    delta = timedelta(
+        days=int(days or 0),
         hours=int(hours),
         minutes=int(minutes),
-        seconds=int(sec),
-        microseconds=int(float(f"0.{fractional_sec}") * 10**6),
+        seconds=int(seconds),
+        microseconds=int(fractional_sec) * 10 ** (6 - len(fractional_sec)) if fractional_sec else 0,
     )
+    return -delta if sign else delta
 
 
 def remove_string_delimiters(s: str) -> str:
@@ -43,3 +67,115 @@ def remove_string_delimiters(s: str) -> str:
     if s[0] == s[-1] == '"' or s[0] == s[-1] == "'":
         return s[1:-1]
     return s
+
+
+def iter_pages(
+    list_func: Callable[..., Tuple[int, List[T]]],
+    page: int = -1,
+    page_size: int = 100,
+    max_concurrent_pages: int = MAX_CONCURRENT_PAGES,
+    **kwargs: Any,
+) -> Iterator[T]:
+    """
+    Iterate over the elements returned by a paginated ArmoniK API listing.
+
+    When all the pages are retrieved, the first page gives the total number of elements. The
+    following pages are then requested concurrently in background threads, a bounded number of
+    them being in flight at once, while the elements already received are consumed. The elements
+    are still yielded in order.
+
+    Args:
+        list_func: The listing method of an ArmoniK client (e.g. 'ArmoniKSessions.list_sessions').
+            It must accept the 'page' and 'page_size' keyword arguments and return the total
+            number of elements along with the elements of the requested page. It is called once
+            per page, a function getting a new client for each call (see 'core.get_client')
+            spreads the concurrent page requests over the pooled channels.
+        page: The page to get. If negative, all the pages are retrieved.
+        page_size: The number of elements in each page.
+        max_concurrent_pages: The maximum number of pages requested at once.
+        **kwargs: Additional keyword arguments passed to 'list_func' (filter, sorting, etc.).
+
+    Yields:
+        The listed elements, in order.
+    """
+    if page >= 0:
+        yield from list_func(page=page, page_size=page_size, **kwargs)[1]
+        return
+
+    total, items = list_func(page=0, page_size=page_size, **kwargs)
+    received = len(items)
+    if not items or received >= total:
+        yield from items
+        return
+
+    # The pages are counted with the size of the first one rather than 'page_size', since the
+    # server may return fewer elements per page than requested. As 'received < total', there is
+    # at least one more page to request.
+    num_pages = -(-total // received)
+    next_page = 1
+    with ThreadPoolExecutor(max_workers=min(max_concurrent_pages, num_pages - 1)) as executor:
+        futures: Deque["Future[Tuple[int, List[T]]]"] = deque()
+
+        def submit_pages() -> None:
+            nonlocal next_page
+            while next_page < num_pages and len(futures) < max_concurrent_pages:
+                futures.append(
+                    executor.submit(list_func, page=next_page, page_size=page_size, **kwargs)
+                )
+                next_page += 1
+
+        submit_pages()
+        yield from items
+        while futures:
+            _, items = futures.popleft().result()
+            submit_pages()
+            received += len(items)
+            yield from items
+
+    # If the pages turned out shorter than the first one, the remaining elements are requested one
+    # page at a time until all of them are received or an empty page is returned.
+    while items and received < total:
+        total, items = list_func(page=next_page, page_size=page_size, **kwargs)
+        next_page += 1
+        received += len(items)
+        yield from items
+
+
+def list_by_ids(
+    list_func: Callable[..., Tuple[int, List[T]]],
+    id_field: Filter,
+    ids: Sequence[str],
+    filter_name: str,
+    id_attr: str = "id",
+) -> List[T]:
+    """
+    Retrieve several objects of the ArmoniK API given their IDs with a single listing request.
+
+    The IDs are combined into a single filter ('id == a or id == b ...') so that all the objects
+    are fetched in one round trip instead of one 'get' request per ID.
+
+    Args:
+        list_func: The listing method of an ArmoniK client (e.g. 'ArmoniKPartitions.list_partitions').
+        id_field: The filter field of the object ID (e.g. 'Partition.id').
+        ids: The IDs of the objects to retrieve.
+        filter_name: The name of the filter keyword argument of 'list_func' (e.g. 'partition_filter').
+        id_attr: The name of the ID attribute on the returned objects.
+
+    Returns:
+        The retrieved objects, in the order of the given IDs, each object being returned once even
+        if its ID is given several times.
+
+    Raises:
+        NotFoundError: If at least one of the IDs does not match any object.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    id_filter = reduce(or_, (id_field == id_ for id_ in unique_ids))
+    found = {
+        getattr(item, id_attr): item
+        for item in iter_pages(list_func, page_size=len(unique_ids), **{filter_name: id_filter})
+    }
+    missing = [id_ for id_ in unique_ids if id_ not in found]
+    if missing:
+        msg = f"No object found with ID(s): {', '.join(missing)}."
+        raise NotFoundError(msg)
+    return [found[id_] for id_ in unique_ids]
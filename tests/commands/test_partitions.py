@@ -2,7 +2,7 @@ from copy import deepcopy
 import pytest
 
 from armonik.client import ArmoniKPartitions
-from armonik.common import Partition
+from armonik.common import Direction, Partition
 
 from conftest import run_cmd_and_assert_exit_code, reformat_cmd_output
 
@@ -63,6 +63,24 @@ def test_partition_list(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == serialized_partitions
 
 
+@pytest.mark.parametrize(
+    ("option", "direction"),
+    [
+        ("", Direction.ASC),
+        ("--sort-direction asc", Direction.ASC),
+        ("--sort-direction DESC", Direction.DESC),
+    ],
+)
+def test_partition_list_sort_direction(mocker, option, direction):
+    list_partitions = mocker.patch.object(
+        ArmoniKPartitions,
+        "list_partitions",
+        return_value=(len(raw_partitions), deepcopy(raw_partitions)),
+    )
+    run_cmd_and_assert_exit_code(f"partition list -e {ENDPOINT} {option}")
+    assert list_partitions.call_args.kwargs["sort_direction"] == direction
+
+
 @pytest.mark.parametrize(
     "cmd, expected_output",
     [
@@ -84,5 +102,22 @@ def test_partition_get(mocker, cmd, expected_output):
             return deepcopy(raw_partitions[1])
 
     mocker.patch.object(ArmoniKPartitions, "get_partition", side_effect=get_partitions_side_effect)
+    mocker.patch.object(
+        ArmoniKPartitions,
+        "list_partitions",
+        return_value=(len(raw_partitions), deepcopy(raw_partitions[::-1])),
+    )
     result = run_cmd_and_assert_exit_code(cmd)
     assert reformat_cmd_output(result.output, deserialize=True) == expected_output
+
+
+def test_partition_get_not_found(mocker):
+    mocker.patch.object(
+        ArmoniKPartitions,
+        "list_partitions",
+        return_value=(1, [deepcopy(raw_partitions[0])]),
+    )
+    result = run_cmd_and_assert_exit_code(
+        f"partition get --endpoint {ENDPOINT} stream unknown", exit_code=1
+    )
+    assert "unknown" in result.output
@@ -3,6 +3,8 @@ import pytest
 from datetime import datetime, timedelta
 from copy import deepcopy
 
+from grpc import RpcError, StatusCode
+
 from armonik.client import ArmoniKSessions
 from armonik.common import Session, TaskOptions, SessionStatus
 from conftest import run_cmd_and_assert_exit_code, reformat_cmd_output
@@ -78,6 +80,22 @@ def test_session_list(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == [serialized_session]
 
 
+def test_session_list_many_pages(mocker):
+    list_sessions = mocker.patch.object(
+        ArmoniKSessions,
+        "list_sessions",
+        autospec=True,
+        side_effect=lambda self, page, page_size, **kwargs: (
+            3,
+            [deepcopy(raw_session)] * (page < 3),
+        ),
+    )
+    result = run_cmd_and_assert_exit_code(f"session list --endpoint {ENDPOINT} --page-size 1")
+    assert reformat_cmd_output(result.output, deserialize=True) == [serialized_session] * 3
+    # The pages are requested through several clients, hence over several pooled channels.
+    assert len({id(call.args[0]) for call in list_sessions.call_args_list}) > 1
+
+
 @pytest.mark.parametrize(
     "cmd",
     [
@@ -90,6 +108,28 @@ def test_session_get(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == serialized_session
 
 
+def test_session_get_unknown_status(mocker):
+    session = deepcopy(raw_session)
+    session.status = 42
+    mocker.patch.object(ArmoniKSessions, "get_session", return_value=session)
+    result = run_cmd_and_assert_exit_code(f"session get --endpoint {ENDPOINT} id")
+    assert reformat_cmd_output(result.output, deserialize=True)["Status"] == "42"
+
+
+def test_session_get_many(mocker):
+    other_session = deepcopy(raw_session)
+    other_session.session_id = "other-id"
+    list_sessions = mocker.patch.object(
+        ArmoniKSessions, "list_sessions", return_value=(2, [other_session, deepcopy(raw_session)])
+    )
+    result = run_cmd_and_assert_exit_code(f"session get --endpoint {ENDPOINT} id other-id")
+    assert reformat_cmd_output(result.output, deserialize=True) == [
+        serialized_session,
+        {**serialized_session, "SessionId": "other-id"},
+    ]
+    assert list_sessions.call_count == 1
+
+
 @pytest.mark.parametrize(
     "cmd",
     [
@@ -124,6 +164,43 @@ def test_session_cancel(mocker, cmd, prompt):
     )
 
 
+def test_session_cancel_many(mocker):
+    mock = mocker.patch.object(
+        ArmoniKSessions, "cancel_session", side_effect=lambda session_id: deepcopy(raw_session)
+    )
+    result = run_cmd_and_assert_exit_code(f"session cancel --confirm --endpoint {ENDPOINT} id1 id2")
+    assert reformat_cmd_output(result.output, deserialize=True) == [serialized_session] * 2
+    assert sorted(call.kwargs["session_id"] for call in mock.call_args_list) == ["id1", "id2"]
+
+
+class DummyRpcError(RpcError):
+    def __init__(self, code, details):
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+
+def test_session_cancel_partial_failure(mocker):
+    def cancel_session(session_id):
+        if session_id == "unknown":
+            raise DummyRpcError(StatusCode.NOT_FOUND, "Session not found")
+        return deepcopy(raw_session)
+
+    mock = mocker.patch.object(ArmoniKSessions, "cancel_session", side_effect=cancel_session)
+    result = run_cmd_and_assert_exit_code(
+        f"session cancel --confirm --endpoint {ENDPOINT} id1 unknown id2", exit_code=1
+    )
+    output, error = result.output.split("╭─ Error")
+    assert reformat_cmd_output(output, deserialize=True) == [serialized_session] * 2
+    assert "unknown: Session not found" in error
+    assert mock.call_count == 3
+
+
 @pytest.mark.parametrize(
     "cmd",
     [
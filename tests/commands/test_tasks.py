@@ -226,26 +226,51 @@ def test_task_list(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == serialized_tasks
 
 
-@pytest.mark.parametrize(
-    "cmd, expected_outputs",
-    [
-        (f"task get --endpoint {ENDPOINT} {serialized_tasks[0]['Id']}", [serialized_tasks[0]]),
-        (
-            f"task get --endpoint {ENDPOINT} {serialized_tasks[0]['Id']} {serialized_tasks[1]['Id']} --debug",
-            serialized_tasks,
+def test_task_list_many_pages(mocker):
+    mocker.patch.object(
+        ArmoniKTasks,
+        "list_tasks",
+        side_effect=lambda page, page_size, **kwargs: (
+            2,
+            deepcopy(raw_tasks[page : page + 1]),
         ),
-    ],
-)
-def test_task_get(mocker, cmd, expected_outputs):
-    def get_task_side_effect(task_id):
-        if task_id == serialized_tasks[0]["Id"]:
-            return deepcopy(raw_tasks[0])
-        elif task_id == serialized_tasks[1]["Id"]:
-            return deepcopy(raw_tasks[1])
+    )
+    result = run_cmd_and_assert_exit_code(f"task list -e {ENDPOINT} --page-size 1")
+    assert reformat_cmd_output(result.output, deserialize=True) == serialized_tasks
 
-    mocker.patch.object(ArmoniKTasks, "get_task", side_effect=get_task_side_effect)
-    result = run_cmd_and_assert_exit_code(cmd)
-    assert reformat_cmd_output(result.output, deserialize=True) == expected_outputs
+
+def test_task_get(mocker):
+    mocker.patch.object(ArmoniKTasks, "get_task", return_value=deepcopy(raw_tasks[0]))
+    result = run_cmd_and_assert_exit_code(
+        f"task get --endpoint {ENDPOINT} {serialized_tasks[0]['Id']}"
+    )
+    assert reformat_cmd_output(result.output, deserialize=True) == [serialized_tasks[0]]
+
+
+def test_task_get_unknown_status(mocker):
+    task = deepcopy(raw_tasks[0])
+    task.status = 42
+    mocker.patch.object(ArmoniKTasks, "get_task", return_value=task)
+    result = run_cmd_and_assert_exit_code(f"task get --endpoint {ENDPOINT} {task.id}")
+    assert reformat_cmd_output(result.output, deserialize=True)[0]["Status"] == "42"
+
+
+def test_task_get_many(mocker):
+    list_tasks = mocker.patch.object(
+        ArmoniKTasks, "list_tasks", return_value=(2, deepcopy(raw_tasks[::-1]))
+    )
+    result = run_cmd_and_assert_exit_code(
+        f"task get --endpoint {ENDPOINT} {serialized_tasks[0]['Id']} {serialized_tasks[1]['Id']} --debug"
+    )
+    assert reformat_cmd_output(result.output, deserialize=True) == serialized_tasks
+    assert list_tasks.call_count == 1
+
+
+def test_task_get_not_found(mocker):
+    mocker.patch.object(ArmoniKTasks, "list_tasks", return_value=(1, deepcopy(raw_tasks[:1])))
+    run_cmd_and_assert_exit_code(
+        f"task get --endpoint {ENDPOINT} {serialized_tasks[0]['Id']} unknown-id", exit_code=1
+    )
 
 
 @pytest.mark.parametrize(
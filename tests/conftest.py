@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from typing import Dict, Optional
 
 from click.testing import CliRunner, Result
@@ -7,6 +9,13 @@ from click.testing import CliRunner, Result
 from armonik_cli.cli import cli
 
 
+@pytest.fixture(autouse=True)
+def cache_home(monkeypatch, tmp_path):
+    # Keep the filter parser cache out of the user's cache directory, starting from an empty one.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
 def run_cmd_and_assert_exit_code(
     cmd: str, exit_code: int = 0, input: Optional[str] = None, env: Optional[Dict[str, str]] = None
 ) -> Result:
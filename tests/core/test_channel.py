@@ -0,0 +1,41 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from armonik.client import ArmoniKSessions
+
+from armonik_cli.core import channel
+from armonik_cli.core.channel import POOL_SIZE, close_channels, get_channel, get_client
+
+
+def test_get_channel_round_robin():
+    channels = [get_channel("localhost:5001") for _ in range(2 * POOL_SIZE)]
+    assert len(set(map(id, channels))) == POOL_SIZE
+    assert channels[:POOL_SIZE] == channels[POOL_SIZE:]
+    assert get_channel("localhost:5002") not in channels
+    close_channels()
+    assert get_channel("localhost:5001") not in channels
+    close_channels()
+
+
+def test_get_client_cached():
+    clients = [get_client(ArmoniKSessions, "localhost:5001") for _ in range(2 * POOL_SIZE)]
+    assert len(set(map(id, clients))) == POOL_SIZE
+    assert clients[:POOL_SIZE] == clients[POOL_SIZE:]
+    close_channels()
+
+
+def test_get_channel_concurrent_cold_start(mocker):
+    channel_pool = channel.ChannelPool
+
+    def slow_channel_pool(endpoint):
+        # Widen the window between the lookup of the pool and its registration.
+        time.sleep(0.05)
+        return channel_pool(endpoint)
+
+    new_pool = mocker.patch.object(channel, "ChannelPool", side_effect=slow_channel_pool)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        channels = list(pool.map(lambda _: get_channel("localhost:5003"), range(8)))
+    assert new_pool.call_count == 1
+    assert len(set(map(id, channels))) == POOL_SIZE
+    close_channels()
@@ -0,0 +1,48 @@
+import io
+import json
+
+import pytest
+
+from armonik.common import Partition
+
+from armonik_cli.core.console import ArmoniKCLIConsole
+
+
+partitions = [
+    Partition(
+        id=f"partition-{i}",
+        parent_partition_ids=[],
+        pod_reserved=1,
+        pod_max=100,
+        pod_configuration={},
+        preemption_percentage=50,
+        priority=1,
+    )
+    for i in range(3)
+]
+
+
+@pytest.mark.parametrize("format", ["json", "yaml", "table"])
+@pytest.mark.parametrize("objs", [partitions, partitions[:1], []])
+def test_formatted_print_stream(format, objs):
+    list_output, stream_output = io.StringIO(), io.StringIO()
+    table_cols = [("ID", "Id"), ("PodMax", "PodMax")]
+
+    ArmoniKCLIConsole(file=list_output).formatted_print(
+        list(objs), format=format, table_cols=table_cols
+    )
+    ArmoniKCLIConsole(file=stream_output).formatted_print(
+        iter(objs), format=format, table_cols=table_cols
+    )
+
+    assert stream_output.getvalue() == list_output.getvalue()
+
+
+@pytest.mark.parametrize("format", ["json", "yaml"])
+def test_formatted_print_not_terminal(format):
+    output = io.StringIO()
+    obj = {"Key": "[bold]value[/bold] " + "x" * 200}
+    ArmoniKCLIConsole(file=output, width=80).formatted_print(obj, format=format)
+    assert obj["Key"] in output.getvalue()
+    if format == "json":
+        assert json.loads(output.getvalue()) == obj
@@ -2,7 +2,7 @@ import pytest
 
 from grpc import RpcError, StatusCode
 
-from armonik_cli.core.decorators import error_handler, base_command
+from armonik_cli.core.decorators import compose, error_handler, base_command
 from armonik_cli.exceptions import NotFoundError, InternalError
 
 
@@ -61,3 +61,17 @@ def test_base_command(decorator):
     assert test_func.__click_params__[0].name == "debug"
     assert test_func.__click_params__[1].name == "output"
     assert test_func.__click_params__[2].name == "endpoint"
+
+
+def test_compose():
+    def append(value):
+        def decorator(func):
+            return lambda: func() + [value]
+
+        return decorator
+
+    @compose(append("a"), append("b"))
+    def stacked():
+        return []
+
+    assert stacked() == ["b", "a"]
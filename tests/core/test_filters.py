@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from datetime import datetime, timedelta
@@ -5,7 +7,7 @@ from datetime import datetime, timedelta
 from armonik.common import Partition, Result, ResultStatus, Session, SessionStatus, Task, TaskStatus
 from armonik.common.filter import PartitionFilter, ResultFilter, SessionFilter, TaskFilter
 
-from armonik_cli.core.filters import FilterParser
+from armonik_cli.core.filters import FilterParser, _cache_file, get_filterable_fields
 
 
 @pytest.mark.parametrize(
@@ -199,3 +201,28 @@ from armonik_cli.core.filters import FilterParser
 )
 def test_filter_parser(args, expr, filter):
     assert FilterParser(*args).parse(expr).to_dict() == filter.to_dict()
+
+
+def test_filter_parser_compiled_once():
+    assert FilterParser.get_parser() is FilterParser.get_parser()
+
+
+def test_get_filterable_fields():
+    fields = get_filterable_fields(SessionFilter)
+    assert "session_id" in fields
+    assert "options" not in fields
+    assert get_filterable_fields(SessionFilter) is fields
+
+
+def test_cache_file(cache_home):
+    cache_file = _cache_file("grammar")
+    assert cache_file is not None and cache_file.parent == cache_home / "armonik"
+    assert cache_file.parent.stat().st_mode & 0o777 == 0o700
+    assert _cache_file("other grammar") != cache_file
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+def test_cache_file_not_private(cache_home):
+    (cache_home / "armonik").mkdir(mode=0o777)
+    (cache_home / "armonik").chmod(0o777)
+    assert _cache_file("grammar") is None
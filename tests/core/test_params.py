@@ -15,13 +15,14 @@ from armonik_cli.core.params import FieldParam
     [
         ("key=value", ("key", "value")),
         ("ke_y=valu_e", ("ke_y", "valu_e")),
+        ("JAVA_OPTS=-Dkey=value", ("JAVA_OPTS", "-Dkey=value")),
     ],
 )
 def test_key_value_pair_param(input, output):
     assert KeyValuePairParam().convert(input, None, None) == output
 
 
-@pytest.mark.parametrize("input", ["key value", "ke?y=value"])
+@pytest.mark.parametrize("input", ["key value", "ke?y=value", "=value", "key="])
 def test_key_value_pair_param_fail(input):
     with pytest.raises(click.BadParameter):
         KeyValuePairParam().convert(input, None, None)
@@ -92,3 +93,10 @@ def test_field_param_invalid(mocker, base_struct, field_name):
 def test_field_param_valid(mocker, base_struct, field_name):
     res = FieldParam(base_struct).convert(field_name, None, None)
     assert type(res) is StringFilter
+
+
+def test_filter_param_cached():
+    param = FilterParam("Session")
+    assert param.convert("session_id = id", None, None) is param.convert(
+        "session_id = id", None, None
+    )
@@ -6,7 +6,8 @@ from datetime import timedelta, datetime
 
 from armonik.common import Session, TaskOptions, SessionStatus
 
-from armonik_cli.core.serialize import CLIJSONEncoder
+from armonik_cli.core import serialize
+from armonik_cli.core.serialize import CLIJSONEncoder, dumps_json, serialize_fields, to_plain
 
 
 @pytest.mark.parametrize(
@@ -72,3 +73,79 @@ from armonik_cli.core.serialize import CLIJSONEncoder
 )
 def test_serialize(obj, obj_dict):
     assert obj_dict == json.loads(json.dumps(obj, cls=CLIJSONEncoder))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "obj",
+    [
+        [
+            TaskOptions(
+                max_duration=timedelta(minutes=5),
+                priority=1,
+                max_retries=2,
+                partition_id="default",
+                options={"k1": "v1"},
+            ),
+            {"CreatedAt": datetime(2024, 1, 1, 12, 30), "Ids": ["a", "b"], "Empty": {}},
+        ],
+        {1: "int key", None: "none key", False: "bool key", 1.5: "float key"},
+        {"ApplicationName": "Séance ✓", "Options": {"clé": "valeur à 5 €"}},
+        {"Big": 2**70, "Negative": -(2**64)},
+    ],
+)
+def test_dumps_json(mocker, use_orjson, obj):
+    if not use_orjson:
+        mocker.patch.object(serialize, "orjson", None)
+    assert dumps_json(obj) == json.dumps(
+        json.loads(json.dumps(obj, cls=CLIJSONEncoder)), indent=2, ensure_ascii=False
+    )
+
+
+def test_to_plain():
+    obj = [
+        TaskOptions(
+            max_duration=timedelta(minutes=5),
+            priority=1,
+            max_retries=2,
+            partition_id="default",
+            options={"k1": "v1"},
+        ),
+        {
+            "CreatedAt": datetime(2024, 1, 1, 12, 30),
+            1: ("a", None),
+            "Status": SessionStatus.RUNNING,
+        },
+    ]
+    plain = to_plain(obj)
+    assert plain == json.loads(json.dumps(obj, cls=CLIJSONEncoder))
+    assert type(plain[1]["Status"]) is int
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        TaskOptions(
+            max_duration=timedelta(minutes=5),
+            priority=1,
+            max_retries=2,
+            partition_id="default",
+            options={"k1": "v1"},
+        ),
+        {
+            "MaxDuration": timedelta(minutes=5),
+            "Priority": 1,
+            "PartitionId": "default",
+            "Options": {},
+        },
+    ],
+)
+def test_serialize_fields(obj):
+    keys = ["PartitionId", "MaxDuration", "Options", "Priority"]
+    serialized = json.loads(json.dumps(obj, cls=CLIJSONEncoder))
+    assert serialize_fields(obj, keys) == [serialized[key] for key in keys]
+
+
+def test_serialize_fields_unsupported_object():
+    with pytest.raises(TypeError):
+        serialize_fields(object(), ["Id"])
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from conftest import run_cmd_and_assert_exit_code
@@ -11,3 +14,11 @@ def test_armonik_version():
 @pytest.mark.parametrize("flag", ["--help", "-h"])
 def test_armonik_help(flag):
     run_cmd_and_assert_exit_code(flag)
+
+
+def test_armonik_lazy_commands():
+    code = (
+        "import sys; from armonik_cli.cli import cli; "
+        "assert not any(m.startswith('armonik_cli.commands.') for m in sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
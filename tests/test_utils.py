@@ -1,8 +1,15 @@
+import threading
+import time
+
 import pytest
 
 from datetime import timedelta
+from types import SimpleNamespace
+
+from armonik.common import Partition
 
-from armonik_cli.utils import parse_time_delta, remove_string_delimiters
+from armonik_cli.exceptions import NotFoundError
+from armonik_cli.utils import iter_pages, list_by_ids, parse_time_delta, remove_string_delimiters
 
 
 @pytest.mark.parametrize(
@@ -14,12 +21,20 @@ from armonik_cli.utils import parse_time_delta, remove_string_delimiters
         ("12:11:10", timedelta(hours=12, minutes=11, seconds=10)),
         ("0:10:0", timedelta(minutes=10)),
         ("-0:10:0", -timedelta(minutes=10)),
+        ("-1.01:10:0.5", -timedelta(days=1, hours=1, minutes=10, milliseconds=500)),
+        ("0:0:1.1234567", timedelta(seconds=1, microseconds=123456)),
     ],
 )
 def test_parse_time_delta(input, output):
     assert parse_time_delta(input) == output
 
 
+@pytest.mark.parametrize("input", ["10", "1.0", "00:10", "1:2:3:4", "a:b:c", "12:11:10."])
+def test_parse_time_delta_fail(input):
+    with pytest.raises(ValueError):
+        parse_time_delta(input)
+
+
 @pytest.mark.parametrize(
     ("input", "output"),
     [
@@ -30,3 +45,90 @@ def test_parse_time_delta(input, output):
 )
 def test_remove_string_delimiters(input, output):
     remove_string_delimiters(input) == output
+
+
+@pytest.mark.parametrize(
+    ("page", "calls", "output"),
+    [
+        (-1, [0, 1, 2], list(range(5))),
+        (1, [1], [2, 3]),
+    ],
+)
+def test_iter_pages(page, calls, output):
+    items = list(range(5))
+    requested = []
+
+    def list_func(page, page_size):
+        requested.append(page)
+        return len(items), items[page * page_size : (page + 1) * page_size]
+
+    assert list(iter_pages(list_func, page=page, page_size=2)) == output
+    # Pages after the first one are requested concurrently, in no particular order.
+    assert sorted(requested) == calls
+
+
+def test_iter_pages_concurrent():
+    items = list(range(20))
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def list_func(page, page_size):
+        with lock:
+            in_flight.append(page)
+            max_in_flight.append(len(in_flight))
+        # Later pages answer faster, the elements must still be yielded in order.
+        time.sleep(0.01 / (page + 1))
+        with lock:
+            in_flight.remove(page)
+        return len(items), items[page * page_size : (page + 1) * page_size]
+
+    assert list(iter_pages(list_func, page_size=2, max_concurrent_pages=3)) == items
+    assert max(max_in_flight) <= 3
+
+
+def test_iter_pages_short_first_page():
+    # An element was deleted between the count and the query of the first page.
+    def list_func(page, page_size):
+        return 3, [0, 1][page * page_size : (page + 1) * page_size]
+
+    assert list(iter_pages(list_func, page_size=10)) == [0, 1]
+
+
+@pytest.mark.parametrize("max_page_size", [1, 3, 4])
+def test_iter_pages_capped_page_size(max_page_size):
+    items = list(range(10))
+
+    def list_func(page, page_size):
+        page_size = min(page_size, max_page_size)
+        return len(items), items[page * page_size : (page + 1) * page_size]
+
+    assert list(iter_pages(list_func, page_size=5)) == items
+
+
+@pytest.mark.parametrize(
+    ("ids", "output"),
+    [
+        (["a", "c"], ["a", "c"]),
+        (["c", "a", "c"], ["c", "a"]),
+    ],
+)
+def test_list_by_ids(ids, output):
+    items = [SimpleNamespace(id=id_) for id_ in ["a", "b", "c"]]
+    calls = []
+
+    def list_func(page, page_size, partition_filter):
+        calls.append((page, page_size))
+        return len(items), items
+
+    result = list_by_ids(list_func, Partition.id, ids, filter_name="partition_filter")
+    assert [item.id for item in result] == output
+    assert calls == [(0, len(set(ids)))]
+
+
+def test_list_by_ids_not_found():
+    def list_func(page, page_size, partition_filter):
+        return 1, [SimpleNamespace(id="a")]
+
+    with pytest.raises(NotFoundError):
+        list_by_ids(list_func, Partition.id, ["a", "b"], filter_name="partition_filter")